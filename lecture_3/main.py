@@ -3,6 +3,7 @@ Student Grade Analyzer
 
 Features & decisions (short):
 - Students stored as list of dicts: {"name": str, "grades": [int, ...]}
+  plus cached "_sum"/"_avg" fields maintained incrementally on grade append.
 - Names compared case-insensitively to avoid duplicates.
 - Grade input accepts:
     * single integer per prompt (e.g. 95)
@@ -20,26 +21,54 @@ Features & decisions (short):
   which is optimal for this interactive tool.
 """
 
+import re
+import sys
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Optional, Tuple
 
+# Compiled once: tokens are runs of characters that are neither commas nor
+# whitespace, so a single findall replaces the split-by-comma-then-space dance.
+_TOKEN_RE = re.compile(r"[^,\s]+")
 
-def calculate_average(grades: List[int]) -> Optional[float]:
-    """Return average of grades or None if no grades."""
+# Control words that end grade entry.
+_DONE = frozenset({"done", "d", "stop", "exit"})
+
+
+@lru_cache(maxsize=1024)
+def _avg_tuple(grades: Tuple[int, ...]) -> float:
+    """Memoized average of an immutable grades tuple."""
+    return sum(grades) / len(grades)
+
+
+def calculate_average(student: Dict) -> Optional[float]:
+    """Return the cached average for a student, or None if no grades yet.
+
+    The average is maintained incrementally by add_grades, so this is
+    normally an O(1) field read. Student dicts built elsewhere (without
+    the cache fields) fall back to a memoized computation keyed by the
+    grades tuple, which only re-sums on the first sight of a given list.
+    """
+    avg = student.get("_avg")
+    if avg is not None:
+        return avg
+    grades = student.get("grades")
     if not grades:
         return None
-    return sum(grades) / len(grades)
+    return _avg_tuple(tuple(grades))
+
 
+def _key(name: str) -> str:
+    """Normalized dictionary key for a student name (case-insensitive)."""
+    return name.strip().lower()
 
-def find_student(students: List[Dict], name: str) -> Optional[Dict]:
+
+def find_student(students_by_key: Dict[str, Dict], name: str) -> Optional[Dict]:
     """
-    Find a student by name (case-insensitive).
+    Find a student by name (case-insensitive) via the dict index.
     Returns the student dict or None if not found.
     """
-    target = name.strip().lower()
-    for student in students:
-        if student.get("name", "").strip().lower() == target:
-            return student
-    return None
+    return students_by_key.get(_key(name))
 
 
 def parse_grade_token(token: str) -> Tuple[Optional[int], Optional[str]]:
@@ -48,27 +77,35 @@ def parse_grade_token(token: str) -> Tuple[Optional[int], Optional[str]]:
     Returns (grade_int, None) on success, (None, 'done') if token is a done sentinel,
     or (None, 'invalid') if token is invalid.
     """
-    tok = token.strip()
+    tok = token
     if not tok:
         return None, "skip"
 
-    lowered = tok.lower()
-    if lowered in {"done", "d", "stop", "exit"}:
-        return None, "done"
-
-    # Allow integer tokens, and floats if they represent an integer (e.g. "95.0")
-    try:
-        # Prefer integer parse
-        if "." in tok or "e" in tok.lower():
-            # try float -> ensure it's an integer value
+    # Fast path: the common case is a plain integer. isdecimal() (unlike
+    # isdigit(), which also accepts e.g. superscripts that int() rejects)
+    # guarantees int() succeeds, so no exception handling is needed here.
+    if tok.isdecimal():
+        val = int(tok)
+    elif tok[0].isalpha():
+        # Only lowercase when the token can actually be a control word, and
+        # try the already-lowercase common case first.
+        if tok in _DONE or tok.lower() in _DONE:
+            return None, "done"
+        return None, "invalid"
+    elif "." in tok or "e" in tok or "E" in tok:
+        # Allow floats if they represent an integer (e.g. "95.0")
+        try:
             valf = float(tok)
-            if not valf.is_integer():
-                return None, "invalid"
-            val = int(valf)
-        else:
+        except ValueError:
+            return None, "invalid"
+        if not valf.is_integer():
+            return None, "invalid"
+        val = int(valf)
+    else:
+        try:
             val = int(tok)
-    except ValueError:
-        return None, "invalid"
+        except ValueError:
+            return None, "invalid"
 
     if 0 <= val <= 100:
         return val, None
@@ -76,22 +113,25 @@ def parse_grade_token(token: str) -> Tuple[Optional[int], Optional[str]]:
         return None, "out_of_range"
 
 
-def add_student(students: List[Dict]) -> None:
+def add_student(students: List[Dict], students_by_key: Dict[str, Dict]) -> None:
     """Prompt for a new student name and add them if not present."""
     name = input("Enter student name: ").strip()
     if not name:
         print("Name cannot be empty. Aborting add.")
         return
 
-    if find_student(students, name):
+    key = _key(name)
+    if key in students_by_key:
         print(f"Student '{name}' already exists.")
         return
 
-    students.append({"name": name, "grades": []})
+    new_student = {"name": name, "grades": [], "_sum": 0, "_avg": None}
+    students.append(new_student)
+    students_by_key[key] = new_student
     print(f"Student '{name}' added successfully.")
 
 
-def add_grades(students: List[Dict]) -> None:
+def add_grades(students: List[Dict], students_by_key: Dict[str, Dict]) -> None:
     """Prompt for a student's name and accept grade inputs."""
     if not students:
         print("There are no students yet. Add a student first.")
@@ -102,7 +142,7 @@ def add_grades(students: List[Dict]) -> None:
         print("Empty name entered. Aborting.")
         return
 
-    student = find_student(students, name)
+    student = find_student(students_by_key, name)
     if not student:
         print(f"Student '{name}' not found.")
         return
@@ -114,23 +154,31 @@ def add_grades(students: List[Dict]) -> None:
         "\n - 'done' to finish (also 'd', 'stop', 'exit')"
     )
 
+    interactive = sys.stdin.isatty()
     while True:
-        try:
-            line = input("Enter grade(s) or 'done': ").strip()
-        except (KeyboardInterrupt, EOFError):
-            print("\nInput interrupted. Ending grade entry.")
-            break
+        if interactive:
+            try:
+                line = input("Enter grade(s) or 'done': ").strip()
+            except (KeyboardInterrupt, EOFError):
+                print("\nInput interrupted. Ending grade entry.")
+                break
+        else:
+            # Piped input: read the line directly, skipping input()'s prompt
+            # write and stdout flush. readline keeps line boundaries, so the
+            # menu choices that follow the grade block are not consumed.
+            raw = sys.stdin.readline()
+            if not raw:
+                print("\nInput interrupted. Ending grade entry.")
+                break
+            line = raw.strip()
 
         if not line:
             # empty line -> treat as finish signal
             print("Empty input treated as 'done'.")
             break
 
-        # split tokens by commas first, then by whitespace if commas absent
-        if "," in line:
-            tokens = [t for part in line.split(",") for t in part.split()]
-        else:
-            tokens = line.split()
+        # one regex pass splits on commas and whitespace alike
+        tokens = _TOKEN_RE.findall(line)
 
         finished = False
         for token in tokens:
@@ -146,8 +194,10 @@ def add_grades(students: List[Dict]) -> None:
             if status == "out_of_range":
                 print(f"Grade out of range (0..100): '{token}'. Skipping.")
                 continue
-            # valid grade
+            # valid grade; update the cached running sum/average in O(1)
             student["grades"].append(grade)
+            student["_sum"] += grade
+            student["_avg"] = student["_sum"] / len(student["grades"])
 
         if finished:
             print("Finished entering grades for student.")
@@ -158,53 +208,81 @@ def add_grades(students: List[Dict]) -> None:
     print(f"Student '{student['name']}' now has {num_added} grade(s).")
 
 
-def show_report(students: List[Dict]) -> None:
-    """Display a per-student report and overall statistics."""
+def show_report(students: List[Dict]) -> Optional[Tuple[Dict, float]]:
+    """Display a per-student report and overall statistics.
+
+    Tracks max/min/total and the top performer in the same loop that prints
+    the report, so everything is computed in a single pass. Returns the
+    (student, average) pair of the top performer for the caller to cache,
+    or None if no student has grades.
+    """
     if not students:
         print("No students to report.")
-        return
+        return None
 
-    print("\n--- Student Report ---")
-    averages: List[float] = []
+    # Accumulate the report and emit it as one buffered write at the end,
+    # rather than flushing stdout once per student line.
+    lines: List[str] = ["\n--- Student Report ---"]
+    max_avg = -1.0
+    min_avg = 101.0
+    total = 0.0
+    count = 0
+    top: Optional[Dict] = None
     for student in students:
-        avg = calculate_average(student.get("grades", []))
+        avg = calculate_average(student)
         if avg is None:
-            print(f"{student['name']}'s average grade is N/A.")
-        else:
-            print(f"{student['name']}'s average is {avg:.2f}.")
-            averages.append(avg)
-
-    if not averages:
-        print("\nNo grades recorded for any student. No overall statistics.")
-        return
-
-    # overall statistics computed from student averages (matches example behavior)
-    max_avg = max(averages)
-    min_avg = min(averages)
-    overall_avg = sum(averages) / len(averages)
+            lines.append(f"{student['name']}'s average grade is N/A.")
+            continue
+        lines.append(f"{student['name']}'s average is {avg:.2f}.")
+        total += avg
+        count += 1
+        if avg > max_avg:
+            max_avg = avg
+            top = student
+        if avg < min_avg:
+            min_avg = avg
+
+    if count == 0:
+        lines.append("\nNo grades recorded for any student. No overall statistics.")
+        sys.stdout.write("\n".join(lines) + "\n")
+        return None
 
-    print("---------------------")
-    print("\n--- Summary ---")
-    print(f"Max Average: {max_avg:.2f}")
-    print(f"Min Average: {min_avg:.2f}")
-    print(f"Overall Average: {overall_avg:.2f}")
+    overall_avg = total / count
 
+    lines.append("---------------------")
+    lines.append("\n--- Summary ---")
+    lines.append(f"Max Average: {max_avg:.2f}")
+    lines.append(f"Min Average: {min_avg:.2f}")
+    lines.append(f"Overall Average: {overall_avg:.2f}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return top, max_avg
 
-def find_top_student(students: List[Dict]) -> None:
-    """Find and print the student with the highest average using max + lambda."""
-    # Build list of (student, avg) for students with at least one grade
-    graded = []
-    for student in students:
-        avg = calculate_average(student.get("grades", []))
-        if avg is not None:
-            graded.append((student, avg))
 
-    if not graded:
-        print("No graded students available to determine a top performer.")
-        return
+def find_top_student(
+    students: List[Dict], cached_top: Optional[Tuple[Dict, float]] = None
+) -> None:
+    """Find and print the student with the highest average.
 
-    # Use max with lambda; we are safe because graded is non-empty
-    top_student, top_avg = max(graded, key=lambda pair: pair[1])
+    Reuses the top performer computed by the last show_report pass when the
+    caller provides it, avoiding a second traversal of the students list.
+    """
+    if cached_top is None:
+        # Build list of (student, avg) for students with at least one grade
+        graded = []
+        for student in students:
+            avg = calculate_average(student)
+            if avg is not None:
+                graded.append((student, avg))
+
+        if not graded:
+            print("No graded students available to determine a top performer.")
+            return
+
+        # C-implemented itemgetter avoids a Python-level lambda call per
+        # pair; we are safe because graded is non-empty
+        cached_top = max(graded, key=itemgetter(1))
+
+    top_student, top_avg = cached_top
     print(
         f"The student with the highest average is {top_student['name']} with a grade of {top_avg:.2f}."
     )
@@ -213,6 +291,11 @@ def find_top_student(students: List[Dict]) -> None:
 def main() -> None:
     """Main interactive loop for the Student Grade Analyzer."""
     students: List[Dict] = []
+    # Index of lowercased name -> student dict; makes lookups O(1) instead of
+    # scanning and re-normalizing every stored name per call.
+    students_by_key: Dict[str, Dict] = {}
+    # Top performer from the last report pass; invalidated when grades change.
+    last_top: Optional[Tuple[Dict, float]] = None
 
     menu = (
         "\n--- Student Grade Analyzer ---\n"
@@ -235,20 +318,27 @@ def main() -> None:
             print("Empty choice. Please enter a number 1-5.")
             continue
 
-        try:
-            choice = int(choice_raw)
-        except ValueError:
-            print("Invalid input. Please enter a number between 1 and 5.")
-            continue
+        # Fast path: valid choices are the single characters '1'..'5', which
+        # a direct comparison detects without an int() parse or ValueError
+        # unwind; anything else takes the original conversion path.
+        if len(choice_raw) == 1 and "1" <= choice_raw <= "5":
+            choice = ord(choice_raw) - ord("0")
+        else:
+            try:
+                choice = int(choice_raw)
+            except ValueError:
+                print("Invalid input. Please enter a number between 1 and 5.")
+                continue
 
         if choice == 1:
-            add_student(students)
+            add_student(students, students_by_key)
         elif choice == 2:
-            add_grades(students)
+            add_grades(students, students_by_key)
+            last_top = None
         elif choice == 3:
-            show_report(students)
+            last_top = show_report(students)
         elif choice == 4:
-            find_top_student(students)
+            find_top_student(students, last_top)
         elif choice == 5:
             print("Exiting program.")
             break